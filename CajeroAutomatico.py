@@ -1,6 +1,117 @@
 import datetime
 import hashlib
 import re
+import time
+import uuid
+from collections import OrderedDict
+
+
+class CacheTransacciones:
+    """Cache acotado de IDs de transacción ya procesados, con expiración por tiempo (TTL).
+
+    Es una cola FIFO: las consultas no renuevan las entradas. Como el TTL es el mismo para todas,
+    el orden de inserción coincide con el orden de expiración, así que un solo OrderedDict sirve
+    de cola y de rueda de tiempo, y la búsqueda, el registro y la expiración cuestan O(1) amortizado.
+    Cada entrada ocupa unos 800 bytes con los valores compactos que guarda Cajero (unos 80 MB con
+    la capacidad por defecto).
+    """
+
+    def __init__(self, capacidad=100_000, ttl_segundos=24 * 60 * 60):
+        self.capacidad = capacidad
+        self.ttl = ttl_segundos
+        self.entradas = OrderedDict()  # {clave: (expiracion_en_segundos, valor)}
+
+    def _expirar(self, ahora):
+        # Elimina desde el frente mientras las entradas más antiguas estén vencidas
+        while self.entradas:
+            expira, _ = next(iter(self.entradas.values()))
+            if expira > ahora:
+                break
+            self.entradas.popitem(last=False)
+
+    def obtener(self, clave):
+        """Devuelve el valor guardado si la clave ya fue procesada y no ha expirado."""
+        self._expirar(time.time())
+        entrada = self.entradas.get(clave)
+        return entrada[1] if entrada else None
+
+    def registrar(self, clave, valor):
+        """Guarda el valor de una transacción nueva, desalojando la más antigua si se llena."""
+        ahora = time.time()
+        self._expirar(ahora)
+        self.entradas[clave] = (ahora + self.ttl, valor)
+        while len(self.entradas) > self.capacidad:
+            self.entradas.popitem(last=False)
+
+
+# Límites de velocidad por ventana: duración en segundos, número de buckets del anillo,
+# monto total y cantidad de operaciones permitidas
+LIMITES_CLIENTE = {
+    "minuto": {"duracion": 60, "buckets": 60, "monto": 2000, "cantidad": 5},
+    "dia": {"duracion": 24 * 60 * 60, "buckets": 96, "monto": 5000, "cantidad": 20}
+}
+LIMITES_CAJERO = {
+    "minuto": {"duracion": 60, "buckets": 60, "monto": 10000, "cantidad": 30},
+    "dia": {"duracion": 24 * 60 * 60, "buckets": 96, "monto": 100000, "cantidad": 500}
+}
+
+# Niveles de resumen para reportes y cuánto se conservan sus buckets (None: sin límite)
+NIVELES_RESUMEN = {
+    "hora": datetime.timedelta(days=31),
+    "dia": datetime.timedelta(days=2 * 365),
+    "mes": None
+}
+MAX_HORAS_RESUMEN = 10 * 365 * 24  # Rango máximo consultable desde el menú (10 años)
+
+
+class VentanaDeslizante:
+    """Contador de monto y cantidad sobre una ventana deslizante, dividido en buckets en anillo.
+
+    Cada bucket cubre duracion / num_buckets segundos; al avanzar el tiempo solo se limpian los
+    buckets vencidos, así que registrar y consultar cuesta O(1) amortizado y la memoria es fija.
+    """
+
+    def __init__(self, duracion_segundos, num_buckets):
+        self.ancho = duracion_segundos / num_buckets
+        self.num_buckets = num_buckets
+        self.montos = [0] * num_buckets
+        self.cantidades = [0] * num_buckets
+        self.monto_total = 0
+        self.cantidad_total = 0
+        self.ultimo_indice = None  # Índice absoluto del último bucket actualizado
+
+    def _avanzar(self, ahora):
+        indice = int(ahora.timestamp() // self.ancho)
+        if self.ultimo_indice is None:
+            self.ultimo_indice = indice
+            return indice
+        # Si el reloj retrocede, seguimos usando el bucket más reciente para no mezclar periodos
+        indice = max(indice, self.ultimo_indice)
+        # Limpiamos los buckets que quedaron fuera de la ventana (como máximo todo el anillo)
+        pasos = min(indice - self.ultimo_indice, self.num_buckets)
+        for i in range(indice - pasos + 1, indice + 1):
+            posicion = i % self.num_buckets
+            self.monto_total -= self.montos[posicion]
+            self.cantidad_total -= self.cantidades[posicion]
+            self.montos[posicion] = 0
+            self.cantidades[posicion] = 0
+        if self.cantidad_total == 0:
+            self.monto_total = 0  # Evita residuos de redondeo con montos decimales
+        self.ultimo_indice = indice
+        return indice
+
+    def totales(self, ahora):
+        """Devuelve (monto, cantidad) acumulados dentro de la ventana."""
+        self._avanzar(ahora)
+        return self.monto_total, self.cantidad_total
+
+    def registrar(self, ahora, monto):
+        posicion = self._avanzar(ahora) % self.num_buckets
+        self.montos[posicion] += monto
+        self.cantidades[posicion] += 1
+        self.monto_total += monto
+        self.cantidad_total += 1
+
 
 class Cajero:
     def __init__(self):
@@ -16,6 +127,13 @@ class Cajero:
         self.clientes_ordenados = []
         self.clientes = {}  # Diccionario de clientes {id_cliente: {"password": str, "saldo": float, "movimientos": list}}
         self.billetes = {200: 0, 100: 0, 50: 0, 20: 0}  # Denominaciones y su cantidad disponible
+        self.transacciones_procesadas = CacheTransacciones()  # IDs de transacción para evitar operaciones duplicadas
+        self.limites_cliente = {ventana: dict(limite) for ventana, limite in LIMITES_CLIENTE.items()}
+        self.limites_cajero = {ventana: dict(limite) for ventana, limite in LIMITES_CAJERO.items()}
+        self.contadores_cliente = {}  # {id_cliente: {ventana: VentanaDeslizante}}
+        self.contadores_cajero = {}  # {id_cajero: {ventana: VentanaDeslizante}}
+        self.resumenes = {}  # {id_cajero: {nivel: {periodo: {tipo: {"cantidad", "suma", "minimo", "maximo", "billetes"}}}}}
+        self.cortes_resumen = {}  # {id_cajero: {nivel: fecha}}: los buckets anteriores a la fecha ya se descartaron
         
         # Calculamos el saldo para todos los cajeros cuando se inicializa la clase
         for cajero in self.cajeros:
@@ -95,13 +213,152 @@ class Cajero:
             print("Por favor ingrese un número válido.")        
     
     def registrar_transaccion(self, cajero, tipo, detalles):
-        """Registra una transacción en el historial del cajero."""
+        """Registra una transacción en el historial del cajero (detalles debe incluir monto y cliente)."""
         transaccion = {
+            "fecha": datetime.datetime.now(),
             "tipo": tipo,
-            "detalles": detalles
+            **detalles
         }
+        self.agregar_al_historial(cajero, transaccion)
+
+    def inicio_periodo(self, fecha, nivel):
+        """Trunca la fecha al inicio de su hora, día o mes."""
+        fecha = fecha.replace(minute=0, second=0, microsecond=0)
+        if nivel in ("dia", "mes"):
+            fecha = fecha.replace(hour=0)
+        if nivel == "mes":
+            fecha = fecha.replace(day=1)
+        return fecha
+
+    def siguiente_periodo(self, fecha, nivel):
+        """Devuelve el inicio del periodo siguiente a uno ya truncado."""
+        if nivel == "hora":
+            return fecha + datetime.timedelta(hours=1)
+        if nivel == "dia":
+            return fecha + datetime.timedelta(days=1)
+        if fecha.month == 12:
+            return fecha.replace(year=fecha.year + 1, month=1)
+        return fecha.replace(month=fecha.month + 1)
+
+    def combinar_resumen(self, destino, por_tipo):
+        """Suma los totales por tipo de operación de por_tipo sobre destino."""
+        for tipo, resumen in por_tipo.items():
+            total = destino.get(tipo)
+            if total is None:
+                destino[tipo] = {**resumen, "billetes": dict(resumen["billetes"])}
+                continue
+            total["cantidad"] += resumen["cantidad"]
+            total["suma"] += resumen["suma"]
+            total["minimo"] = min(total["minimo"], resumen["minimo"])
+            total["maximo"] = max(total["maximo"], resumen["maximo"])
+            for denominacion, cantidad in resumen["billetes"].items():
+                total["billetes"][denominacion] = total["billetes"].get(denominacion, 0) + cantidad
+
+    def actualizar_resumen(self, cajero, transaccion):
+        """Suma la transacción a los resúmenes por hora, día y mes del cajero, por tipo de operación."""
+        monto = transaccion['monto']
+        por_tipo = {transaccion['tipo']: {
+            "cantidad": 1, "suma": monto, "minimo": monto, "maximo": monto,
+            "billetes": dict(transaccion.get('desglose', {}))
+        }}
+        niveles = self.resumenes.setdefault(cajero['id'], {nivel: {} for nivel in NIVELES_RESUMEN})
+        for nivel, buckets in niveles.items():
+            clave = self.inicio_periodo(transaccion['fecha'], nivel)
+            self.combinar_resumen(buckets.setdefault(clave, {}), por_tipo)
+
+        # Descartamos los buckets finos más antiguos que su retención; los niveles mayores los cubren
+        cortes = self.cortes_resumen.setdefault(cajero['id'], {})
+        for nivel, buckets in niveles.items():
+            retencion = NIVELES_RESUMEN[nivel]
+            if retencion is None:
+                continue
+            limite = transaccion['fecha'] - retencion
+            cortes[nivel] = max(cortes.get(nivel, limite), limite)
+            while buckets and next(iter(buckets)) < limite:
+                del buckets[next(iter(buckets))]
+
+    def agregar_al_historial(self, cajero, transaccion):
+        """Agrega la transacción al historial del cajero y actualiza sus resúmenes."""
         cajero['historial'].append(transaccion)
-        
+        self.actualizar_resumen(cajero, transaccion)
+
+    def rango_efectivo(self, cajero, inicio, fin):
+        """Devuelve el rango semiabierto (desde, hasta) que realmente cubren los resúmenes para inicio y fin.
+
+        Los extremos se redondean a la hora; si los buckets por hora o por día que harían falta en un
+        extremo ya se descartaron, ese extremo se amplía al día o mes completo.
+        """
+        cortes = self.cortes_resumen.get(cajero['id'], {})
+        desde = self.inicio_periodo(inicio, "hora")
+        hasta = self.siguiente_periodo(self.inicio_periodo(fin, "hora"), "hora")
+        for nivel, mayor in (("hora", "dia"), ("dia", "mes")):
+            corte = cortes.get(nivel)
+            if corte is None:
+                continue
+            # Al inicio se usan buckets finos desde 'desde'; al final, desde el inicio del periodo mayor
+            if desde < corte:
+                desde = self.inicio_periodo(desde, mayor)
+            inicio_mayor = self.inicio_periodo(hasta, mayor)
+            if hasta != inicio_mayor and max(inicio_mayor, desde) < corte:
+                hasta = self.siguiente_periodo(inicio_mayor, mayor)
+        return desde, hasta
+
+    def consultar_resumen(self, cajero, inicio, fin):
+        """Combina los resúmenes del cajero entre inicio y fin usando los buckets más gruesos posibles.
+
+        El rango cubierto es el que devuelve rango_efectivo.
+        """
+        niveles = self.resumenes.get(cajero['id'])
+        if not niveles:
+            return {}
+
+        desde, hasta = self.rango_efectivo(cajero, inicio, fin)
+
+        # Buckets finos solo en los extremos, hasta alinear con el nivel mayor
+        claves = []
+        for nivel, mayor in (("hora", "dia"), ("dia", "mes")):
+            paso = datetime.timedelta(hours=1) if nivel == "hora" else datetime.timedelta(days=1)
+            while desde < hasta and desde != self.inicio_periodo(desde, mayor):
+                claves.append((nivel, desde))
+                desde += paso
+            while desde < hasta and hasta != self.inicio_periodo(hasta, mayor):
+                hasta -= paso
+                claves.append((nivel, hasta))
+        while desde < hasta:
+            claves.append(("mes", desde))
+            desde = self.siguiente_periodo(desde, "mes")
+
+        combinado = {}
+        for nivel, clave in claves:
+            por_tipo = niveles[nivel].get(clave)
+            if por_tipo:
+                self.combinar_resumen(combinado, por_tipo)
+        return combinado
+
+    def mostrar_resumen(self, horas):
+        """Muestra los totales por tipo de operación del cajero seleccionado en las últimas horas."""
+        if not self.cajero_seleccionado:
+            print("No se ha seleccionado un cajero.")
+            return
+
+        horas = min(horas, MAX_HORAS_RESUMEN)
+        fin = datetime.datetime.now()
+        inicio = fin - datetime.timedelta(hours=horas)
+        # Los extremos pueden ampliarse a la hora, día o mes completo; mostramos el periodo realmente usado
+        desde, hasta = self.rango_efectivo(self.cajero_seleccionado, inicio, fin)
+        periodo = f"del {desde:%Y-%m-%d %H:%M} al {hasta:%Y-%m-%d %H:%M}"
+        resumen = self.consultar_resumen(self.cajero_seleccionado, inicio, fin)
+        if not resumen:
+            print(f"No hay transacciones {periodo} para el cajero en {self.cajero_seleccionado['ubicacion']}.")
+            return
+
+        print(f"\nResumen {periodo} para el cajero en {self.cajero_seleccionado['ubicacion']}:")
+        for tipo, totales in resumen.items():
+            print(f"{tipo}: {totales['cantidad']} operaciones, Total: S/.{totales['suma']}, "
+                  f"Mínimo: S/.{totales['minimo']}, Máximo: S/.{totales['maximo']}")
+            if totales["billetes"]:
+                print(f"  Billetes entregados: {totales['billetes']}")
+
     def mostrar_historial(self):
         if not self.cajero_seleccionado:
             print("No se ha seleccionado un cajero.")
@@ -212,11 +469,102 @@ class Cajero:
         print(f"No se encontró un cajero con la ubicación: {ubicacion}")
         return None
         
-    def retirar(self, id_cliente, password, monto):
+    def transaccion_repetida(self, id_cliente, id_transaccion, solicitud):
+        """Indica si el ID de transacción ya fue usado por el cliente y devuelve (procesada, resultado).
+
+        Si la solicitud coincide con la original se devuelve una copia del resultado original;
+        si el ID se reutiliza para otra operación se rechaza y el resultado es None.
+        """
+        if id_transaccion is None:
+            return False, None
+        entrada = self.transacciones_procesadas.obtener((id_cliente, id_transaccion))
+        if entrada is None:
+            return False, None
+        huella, resultado = entrada
+        if huella != self.huella_solicitud(solicitud):
+            print(f"El ID de transacción '{id_transaccion}' ya se usó para otra operación. Operación rechazada.")
+            return True, None
+        print(f"La transacción '{id_transaccion}' ya fue procesada. No se repetirá la operación.")
+        # Reconstruimos un diccionario nuevo en cada reintento a partir de la forma compacta
+        return True, {clave: dict(valor) if isinstance(valor, tuple) else valor for clave, valor in resultado}
+
+    def huella_solicitud(self, solicitud):
+        """Resume el tipo y los parámetros de una operación en un entero, sin depender del orden de los billetes."""
+        return hash(tuple(
+            (clave, tuple(sorted(valor.items())) if isinstance(valor, dict) else valor)
+            for clave, valor in sorted(solicitud.items())
+        ))
+
+    def registrar_resultado(self, id_cliente, id_transaccion, solicitud, resultado):
+        """Guarda la huella de la solicitud y el resultado de una operación exitosa para responder a reintentos."""
+        if id_transaccion is not None:
+            # Guardamos tuplas en lugar de diccionarios para que cada entrada ocupe poca memoria
+            compacto = tuple(
+                (clave, tuple(valor.items()) if isinstance(valor, dict) else valor)
+                for clave, valor in resultado.items()
+            )
+            self.transacciones_procesadas.registrar(
+                (id_cliente, id_transaccion), (self.huella_solicitud(solicitud), compacto)
+            )
+        return resultado
+
+    def obtener_contadores(self, contadores, clave, limites):
+        """Devuelve (creándolos si hace falta) los contadores de velocidad de un cliente o cajero."""
+        por_ventana = contadores.setdefault(clave, {})
+        for ventana, limite in limites.items():
+            if ventana not in por_ventana:
+                por_ventana[ventana] = VentanaDeslizante(limite["duracion"], limite["buckets"])
+        return por_ventana
+
+    def verificar_limites(self, id_cliente, monto):
+        """Verifica que la operación no supere los límites por minuto y por día del cliente y del cajero."""
+        if not isinstance(monto, (int, float)) or monto <= 0:
+            print("El monto debe ser un número positivo y mayor que cero.")
+            return False
+
+        ahora = datetime.datetime.now()
+        contadores = self.obtener_contadores(self.contadores_cliente, id_cliente, self.limites_cliente)
+        revisiones = [("la cuenta", contadores, self.limites_cliente)]
+        if self.cajero_seleccionado:
+            contadores = self.obtener_contadores(
+                self.contadores_cajero, self.cajero_seleccionado['id'], self.limites_cajero
+            )
+            revisiones.append(("el cajero", contadores, self.limites_cajero))
+
+        for nombre, contadores, limites in revisiones:
+            for ventana, limite in limites.items():
+                monto_usado, cantidad_usada = contadores[ventana].totales(ahora)
+                if cantidad_usada + 1 > limite["cantidad"]:
+                    print(f"Se alcanzó el límite de operaciones por {ventana} para {nombre}.")
+                    return False
+                if monto_usado + monto > limite["monto"]:
+                    print(f"La operación supera el límite de S/.{limite['monto']} por {ventana} para {nombre}.")
+                    return False
+        return True
+
+    def registrar_limites(self, id_cliente, monto):
+        """Suma la operación a los contadores de velocidad del cliente y del cajero seleccionado."""
+        ahora = datetime.datetime.now()
+        for ventana in self.obtener_contadores(self.contadores_cliente, id_cliente, self.limites_cliente).values():
+            ventana.registrar(ahora, monto)
+        if self.cajero_seleccionado:
+            contadores = self.obtener_contadores(
+                self.contadores_cajero, self.cajero_seleccionado['id'], self.limites_cajero
+            )
+            for ventana in contadores.values():
+                ventana.registrar(ahora, monto)
+
+    def retirar(self, id_cliente, password, monto, id_transaccion=None):
         if not self.validar_cliente(id_cliente, password):
             print("Cliente o contraseña incorrectos.")
             return
 
+        # Si es un reintento de una transacción ya procesada, devolvemos el resultado original
+        solicitud = {"tipo": "Retiro", "monto": monto}
+        procesada, resultado = self.transaccion_repetida(id_cliente, id_transaccion, solicitud)
+        if procesada:
+            return resultado
+
         # Validación para asegurar que el monto sea un número positivo
         if not isinstance(monto, (int, float)) or monto <= 0:
             print("El monto debe ser un número positivo y mayor que cero.")
@@ -231,6 +579,9 @@ class Cajero:
             print("No se ha seleccionado un cajero válido.")
             return
 
+        if not self.verificar_limites(id_cliente, monto):
+            return
+
         # Calculamos el desglose de billetes
         desglose_billetes = self.calcular_desglose_billetes(self.cajero_seleccionado, monto)
 
@@ -250,24 +601,36 @@ class Cajero:
 
         # Actualizar saldo del cliente y registrar el movimiento
         self.clientes[id_cliente]["saldo"] -= monto
+        self.registrar_limites(id_cliente, monto)
         self.clientes[id_cliente]["movimientos"].append((datetime.datetime.now(), f"Retiro: -S/.{monto}"))
     
         # Agregar la transacción al historial del cajero
-        self.cajero_seleccionado['historial'].append({
+        self.agregar_al_historial(self.cajero_seleccionado, {
             "fecha": datetime.datetime.now(),
             "tipo": "Retiro",
             "monto": monto,
-            "cliente": id_cliente
+            "cliente": id_cliente,
+            "desglose": desglose_billetes
         })
     
         print(f"Retiro exitoso de S/.{monto}")
         print(f"Desglose de billetes: {desglose_billetes}")
+        return self.registrar_resultado(id_cliente, id_transaccion, solicitud, {
+            "tipo": "Retiro",
+            "monto": monto,
+            "desglose": dict(desglose_billetes)
+        })
 
         
-    def depositar(self, id_cliente, password, billetes_depositados):
+    def depositar(self, id_cliente, password, billetes_depositados, id_transaccion=None):
         if not self.validar_cliente(id_cliente, password):
             print("Cliente o contraseña incorrectos.")
             return
+
+        solicitud = {"tipo": "Depósito", "billetes": dict(billetes_depositados)}
+        procesada, resultado = self.transaccion_repetida(id_cliente, id_transaccion, solicitud)
+        if procesada:
+            return resultado
     
         total_deposito = sum(denominacion * cantidad for denominacion, cantidad in billetes_depositados.items())
     
@@ -280,7 +643,7 @@ class Cajero:
     
         # Agregar la transacción al historial del cajero seleccionado
         if self.cajero_seleccionado:
-            self.cajero_seleccionado['historial'].append({
+            self.agregar_al_historial(self.cajero_seleccionado, {
                 'fecha': datetime.datetime.now(),
                 'tipo': 'Depósito',
                 'monto': total_deposito,
@@ -288,13 +651,22 @@ class Cajero:
             })
     
         print(f"Depósito exitoso de S/.{total_deposito}")
+        return self.registrar_resultado(id_cliente, id_transaccion, solicitud, {
+            "tipo": "Depósito",
+            "monto": total_deposito
+        })
 
 
-    def transferir(self, id_origen, password, id_destino, monto):
+    def transferir(self, id_origen, password, id_destino, monto, id_transaccion=None):
         if not self.validar_cliente(id_origen, password):
             print("Cliente o contraseña incorrectos.")
             return
 
+        solicitud = {"tipo": "Transferencia", "monto": monto, "destino": id_destino}
+        procesada, resultado = self.transaccion_repetida(id_origen, id_transaccion, solicitud)
+        if procesada:
+            return resultado
+
         if id_destino not in self.clientes:
             print("Cuenta destino no encontrada.")
             return
@@ -302,15 +674,19 @@ class Cajero:
         if self.clientes[id_origen]["saldo"] < monto:
             print("Saldo insuficiente para la transferencia.")
             return
+
+        if not self.verificar_limites(id_origen, monto):
+            return
     
         self.clientes[id_origen]["saldo"] -= monto
+        self.registrar_limites(id_origen, monto)
         self.clientes[id_destino]["saldo"] += monto
         self.clientes[id_origen]["movimientos"].append((datetime.datetime.now(), f"Transferencia a {id_destino}: -S/.{monto}"))
         self.clientes[id_destino]["movimientos"].append((datetime.datetime.now(), f"Transferencia de {id_origen}: +S/.{monto}"))
     
         # Agregar las transacciones al historial del cajero seleccionado
         if self.cajero_seleccionado:
-            self.cajero_seleccionado['historial'].append({
+            self.agregar_al_historial(self.cajero_seleccionado, {
                 'fecha': datetime.datetime.now(),
                 'tipo': 'Transferencia',
                 'monto': monto,
@@ -318,6 +694,11 @@ class Cajero:
             })
     
         print(f"Transferencia de S/.{monto} a {id_destino} realizada con éxito.")
+        return self.registrar_resultado(id_origen, id_transaccion, solicitud, {
+            "tipo": "Transferencia",
+            "monto": monto,
+            "destino": id_destino
+        })
 
 
     def consultar_movimientos(self, id_cliente, password):
@@ -346,21 +727,30 @@ class Cajero:
 
             print(f"{color}{fecha_formateada} - {operacion} (Cajero: {ubicacion_cajero})\033[0m")
 
-    def pagar_servicio(self, id_cliente, password, monto, servicio):
+    def pagar_servicio(self, id_cliente, password, monto, servicio, id_transaccion=None):
         if not self.validar_cliente(id_cliente, password):
             print("Cliente o contraseña incorrectos.")
             return
 
+        solicitud = {"tipo": "Pago de servicio", "monto": monto, "servicio": servicio}
+        procesada, resultado = self.transaccion_repetida(id_cliente, id_transaccion, solicitud)
+        if procesada:
+            return resultado
+
         if self.clientes[id_cliente]["saldo"] < monto:
             print("Saldo insuficiente para el pago del servicio.")
             return
 
+        if not self.verificar_limites(id_cliente, monto):
+            return
+
         self.clientes[id_cliente]["saldo"] -= monto
+        self.registrar_limites(id_cliente, monto)
         self.clientes[id_cliente]["movimientos"].append((datetime.datetime.now(), f"Pago de servicio '{servicio}': -S/.{monto}"))
     
         # Agregar la transacción al historial del cajero seleccionado
         if self.cajero_seleccionado:
-            self.cajero_seleccionado['historial'].append({
+            self.agregar_al_historial(self.cajero_seleccionado, {
                 'fecha': datetime.datetime.now(),
                 'tipo': 'Pago de servicio',
                 'monto': monto,
@@ -369,6 +759,11 @@ class Cajero:
             })
     
         print(f"Pago de servicio '{servicio}' realizado exitosamente por S/.{monto}")
+        return self.registrar_resultado(id_cliente, id_transaccion, solicitud, {
+            "tipo": "Pago de servicio",
+            "monto": monto,
+            "servicio": servicio
+        })
 
     
     def mostrar_menu(self):
@@ -407,7 +802,8 @@ class Cajero:
                         print("4. Agregar nuevo cajero")
                         print("5. Ver cajeros disponibles")
                         print("6. Ver historial de cajero")
-                        print("7. Cerrar sesión")
+                        print("7. Ver resumen de operaciones por periodo")
+                        print("8. Cerrar sesión")
                         sub_opcion = input("Seleccione una opción: ")
                         
                         if sub_opcion == "1":
@@ -437,6 +833,17 @@ class Cajero:
                                 print("No se ha seleccionado un cajero.")
 
                         elif sub_opcion == "7":
+                            try:
+                                horas = int(input("Ingrese el número de horas a consultar: "))
+                                if horas <= 0:
+                                    print("El número de horas debe ser mayor que cero.")
+                                elif horas > MAX_HORAS_RESUMEN:
+                                    print(f"El número de horas no puede ser mayor que {MAX_HORAS_RESUMEN}.")
+                                else:
+                                    self.mostrar_resumen(horas)
+                            except (ValueError, OverflowError):
+                                print("Por favor ingrese un número válido.")
+                        elif sub_opcion == "8":
                             print("Cerrando sesión de administrador.")
                             break  # Sale del ciclo y regresa al menú principal
                         else:
@@ -474,7 +881,7 @@ class Cajero:
                         print("El monto debe ser mayor que cero.")
                         continue
                     if self.menu_decision("retirar dinero"):
-                        self.retirar(id_cliente, password, monto)
+                        self.retirar(id_cliente, password, monto, uuid.uuid4().hex)
                 except ValueError:
                     print("Por favor ingrese un monto válido.")
                 
@@ -498,7 +905,7 @@ class Cajero:
                         
                 if sum(billetes_depositados.values()) > 0:
                     if self.menu_decision("depositar dinero"):
-                        self.depositar(id_cliente, password, billetes_depositados)
+                        self.depositar(id_cliente, password, billetes_depositados, uuid.uuid4().hex)
                 else:
                     print("No se ha depositado ninguna cantidad válida. La operación ha sido cancelada.")
             
@@ -514,7 +921,7 @@ class Cajero:
                         print("El monto debe ser mayor que cero.")
                         continue
                     if self.menu_decision("transferir dinero"):
-                        self.transferir(id_cliente, password, id_destino, monto)
+                        self.transferir(id_cliente, password, id_destino, monto, uuid.uuid4().hex)
                 except ValueError:
                     print("Por favor ingrese un monto válido.")
                 
@@ -542,7 +949,7 @@ class Cajero:
 
                             # Si pasa la validación, confirmar la operación
                             if self.menu_decision("pagar el servicio"):
-                                self.pagar_servicio(id_cliente, password, monto, servicio)
+                                self.pagar_servicio(id_cliente, password, monto, servicio, uuid.uuid4().hex)
                                 break  # Salir del bucle una vez realizada la operación
                             else:
                                 break  # Salir del bucle si la decisión es no
@@ -709,14 +1116,15 @@ class Cajero:
 
 
 
-# Crear una instancia del Cajero y mostrar el menú
-cajero = Cajero()
+if __name__ == "__main__":
+    # Crear una instancia del Cajero y mostrar el menú
+    cajero = Cajero()
 
-# Agregar algunos clientes con sus respectivas contraseñas y saldos iniciales
-cajero.agregar_cliente("manuel", "123", 2000)
-cajero.agregar_cliente("wilbert", "345", 800)
-cajero.agregar_cliente("jesus", "456", 500)
-cajero.agregar_cliente("harold", "234", 1500)
+    # Agregar algunos clientes con sus respectivas contraseñas y saldos iniciales
+    cajero.agregar_cliente("manuel", "123", 2000)
+    cajero.agregar_cliente("wilbert", "345", 800)
+    cajero.agregar_cliente("jesus", "456", 500)
+    cajero.agregar_cliente("harold", "234", 1500)
 
-# Mostrar el menú del cajero
-cajero.mostrar_menu()
\ No newline at end of file
+    # Mostrar el menú del cajero
+    cajero.mostrar_menu()
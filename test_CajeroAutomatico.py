@@ -0,0 +1,57 @@
+import datetime
+import random
+import unittest
+
+from CajeroAutomatico import NIVELES_RESUMEN, Cajero
+
+
+class TestResumenes(unittest.TestCase):
+    def setUp(self):
+        # Tres años de transacciones en orden cronológico para forzar la compactación de buckets
+        random.seed(1)
+        self.cajero = Cajero()
+        self.atm = self.cajero.cajeros[0]
+        self.ahora = datetime.datetime.now()
+        fecha = self.ahora - datetime.timedelta(days=3 * 365)
+        while fecha < self.ahora:
+            self.cajero.agregar_al_historial(self.atm, {
+                "fecha": fecha,
+                "tipo": random.choice(["Retiro", "Depósito"]),
+                "monto": random.randint(1, 100),
+                "cliente": "manuel"
+            })
+            fecha += datetime.timedelta(minutes=random.randint(30, 600))
+
+    def historial_entre(self, desde, hasta):
+        """Totales por tipo recorriendo el historial completo."""
+        totales = {}
+        for transaccion in self.atm['historial']:
+            if desde <= transaccion['fecha'] < hasta:
+                cantidad, suma = totales.get(transaccion['tipo'], (0, 0))
+                totales[transaccion['tipo']] = (cantidad + 1, suma + transaccion['monto'])
+        return totales
+
+    def test_resumen_coincide_con_historial_cerca_de_la_retencion(self):
+        for retencion in (NIVELES_RESUMEN["hora"], NIVELES_RESUMEN["dia"]):
+            limite = self.ahora - retencion
+            for _ in range(300):
+                fin = limite + datetime.timedelta(hours=random.uniform(-72, 72))
+                inicio = fin - datetime.timedelta(hours=random.uniform(0, 24 * random.choice([1, 3, 40, 400])))
+                resumen = self.cajero.consultar_resumen(self.atm, inicio, fin)
+                desde, hasta = self.cajero.rango_efectivo(self.atm, inicio, fin)
+
+                self.assertLessEqual(desde, inicio)
+                self.assertGreater(hasta, fin)
+                obtenido = {tipo: (total["cantidad"], total["suma"]) for tipo, total in resumen.items()}
+                self.assertEqual(obtenido, self.historial_entre(desde, hasta), (inicio, fin))
+
+    def test_rango_reciente_no_se_amplia(self):
+        fin = self.ahora
+        inicio = fin - datetime.timedelta(hours=5)
+        desde, hasta = self.cajero.rango_efectivo(self.atm, inicio, fin)
+        self.assertEqual(desde, inicio.replace(minute=0, second=0, microsecond=0))
+        self.assertEqual(hasta, fin.replace(minute=0, second=0, microsecond=0) + datetime.timedelta(hours=1))
+
+
+if __name__ == "__main__":
+    unittest.main()